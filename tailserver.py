@@ -4,143 +4,532 @@ Simple TCP tail server:
 - Accepts multiple clients concurrently
 - Watches a logfile and broadcasts new lines to all connected clients
 - Handles logrotate with copytruncate by checking file inode/size and seeking appropriately
+- Uses inotify on Linux to wake up on file changes, falls back to polling elsewhere
+- The logfile may also be a named pipe (FIFO), read as data arrives
 - CLI: logfile, --host (default 0.0.0.0), --port
 """
 
 import argparse
 import asyncio
+import ctypes
+import logging
+import logging.handlers
 import os
+import queue
+import socket
 import stat
+import struct
+import sys
 import time
 
+logger = logging.getLogger("tailserver")
 
-async def tail_file(path, broadcaster, poll_interval=0.2):
-    """Watch file and send appended lines to broadcaster(callback).
+# Max bytes read from the logfile per syscall (and so per broadcast)
+READ_SIZE = 64 * 1024
+
+# inotify(7) constants (Linux only)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = 0o00004000
+IN_CLOEXEC = 0o02000000
+
+
+class InotifyWatcher:
+    """Wake up the tail loop when the logfile or its directory changes (Linux only).
+    Talks to inotify through ctypes so no third-party package is needed.
+    The logfile is watched for writes/moves/deletes, the parent directory for the
+    logfile name being (re)created, which covers logrotate rename and copytruncate.
+    """
+
+    _header = struct.Struct("iIII")
+
+    def __init__(self, path):
+        self.name = os.fsencode(os.path.basename(path))
+        self.libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self.changed = asyncio.Event()
+        self.moved = False
+        self.file_wd = None
+        try:
+            self.dir_wd = self._add_watch(os.path.dirname(os.path.abspath(path)), IN_CREATE | IN_MOVED_TO)
+            self.watch_file(path)
+            self.loop = asyncio.get_running_loop()
+            self.loop.add_reader(self.fd, self._on_readable)
+        except Exception:
+            os.close(self.fd)
+            raise
+
+    def _add_watch(self, path, mask):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch {path}: {os.strerror(err)}")
+        return wd
+
+    def watch_file(self, path, fd=None):
+        """(Re)attach the file watch, e.g. after the logfile was reopened.
+        Given the open fd, the watch goes through /proc/self/fd so it lands on the
+        very file being read, even if the path was rotated again after the open.
+        Without /proc it falls back to the path; if that race hits, new lines are
+        only noticed on the watch_timeout fallback (5 s by default).
+        """
+        mask = IN_MODIFY | IN_ATTRIB | IN_MOVE_SELF | IN_DELETE_SELF
+        old_wd = self.file_wd
+        wd = None
+        if fd is not None:
+            try:
+                wd = self._add_watch(f"/proc/self/fd/{fd}", mask)
+            except OSError:
+                wd = None
+        if wd is None:
+            try:
+                wd = self._add_watch(path, mask)
+            except FileNotFoundError:
+                # Not there yet; the directory watch reports when it appears
+                wd = None
+        self.file_wd = wd
+        if old_wd is not None and old_wd != self.file_wd:
+            # Stop waking up on writes to the rotated-away file
+            self.libc.inotify_rm_watch(self.fd, old_wd)
+
+    def _on_readable(self):
+        relevant = False
+        moved = False
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            pos = 0
+            while pos < len(buf):
+                wd, mask, _cookie, length = self._header.unpack_from(buf, pos)
+                pos += self._header.size
+                name = buf[pos:pos + length].rstrip(b"\0")
+                pos += length
+                if mask & IN_Q_OVERFLOW:
+                    relevant = moved = True
+                elif wd == self.file_wd:
+                    relevant = True
+                    # IN_ATTRIB covers unlink (link count drops while we hold the fd)
+                    if mask & (IN_ATTRIB | IN_MOVE_SELF | IN_DELETE_SELF):
+                        moved = True
+                elif wd == self.dir_wd and name == self.name:
+                    relevant = moved = True
+        if moved:
+            self.moved = True
+        if relevant:
+            self.changed.set()
+
+    async def wait(self, timeout):
+        """Block until a relevant event arrives or timeout expires.
+        Events arriving while the caller is busy reading collapse into one wake-up.
+        The timeout keeps us correct on filesystems that don't deliver inotify
+        events (NFS, some container bind mounts) by degrading to slow polling.
+        Returns True if the logfile path may now refer to a different file.
+        """
+        try:
+            await asyncio.wait_for(self.changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            # No events at all: we can't tell, so let the caller check
+            self.moved = True
+        self.changed.clear()
+        moved, self.moved = self.moved, False
+        return moved
+
+    def close(self):
+        self.loop.remove_reader(self.fd)
+        os.close(self.fd)
+
+
+def split_lines(pending, chunk):
+    """Append chunk to the held-back partial line and split off the complete lines.
+    Returns (data to send or None, new pending partial line).
+    """
+    data = pending + chunk if pending else chunk
+    idx = data.rfind(b"\n")
+    if idx == len(data) - 1:
+        return data, b""
+    if idx >= 0:
+        # memoryview slice: the complete lines go out without a copy,
+        # one shared buffer for all clients
+        return memoryview(data)[:idx + 1], data[idx + 1:]
+    if len(data) < READ_SIZE:
+        return None, data
+    # Overlong line: don't buffer it forever
+    return data, b""
+
+
+async def tail_fifo(path, broadcaster):
+    """Stream a named pipe to broadcaster(callback), woken by loop.add_reader.
+    We hold a write end open ourselves so the pipe never reports EOF (and never
+    spins the reader) while no writer is attached; reads just wait for the next one.
+    """
+    loop = asyncio.get_running_loop()
+    fd = keep_fd = None
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        keep_fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        readable = asyncio.Event()
+        loop.add_reader(fd, readable.set)
+        try:
+            pending = b""
+            while True:
+                await readable.wait()
+                readable.clear()
+                # Drain everything the pipe has right now
+                while True:
+                    try:
+                        chunk = os.read(fd, READ_SIZE)
+                    except BlockingIOError:
+                        break
+                    if not chunk:
+                        break
+                    data, pending = split_lines(pending, chunk)
+                    if data is not None:
+                        await broadcaster(data)
+                    # Let the client senders run before reading the next chunk
+                    await asyncio.sleep(0)
+        finally:
+            loop.remove_reader(fd)
+    except Exception as e:
+        logger.error("tail_fifo error: %s", e)
+    finally:
+        for d in (fd, keep_fd):
+            if d is not None:
+                os.close(d)
+
+
+async def tail_file(path, broadcaster, poll_interval=0.2, watch_timeout=5.0):
+    """Watch file and send appended data to broadcaster(callback).
+    Appended data is read in READ_SIZE chunks and sent as whole lines; a trailing
+    partial line is held back until its newline arrives.
     Handles copytruncate by detecting if file was truncated or replaced.
-    broadcaster(line: str)
+    On Linux waits for inotify events instead of polling every poll_interval.
+    broadcaster(data: bytes-like)
+    Named pipes are handed off to tail_fifo.
     """
     try:
-        # Read logfile as UTF-8 (replace undecodable bytes if any)
-        with open(path, "r", encoding="utf-8", errors="replace") as f:
+        is_fifo = stat.S_ISFIFO(os.stat(path).st_mode)
+    except OSError:
+        is_fifo = False
+    if is_fifo:
+        await tail_fifo(path, broadcaster)
+        return
+
+    watcher = None
+    if sys.platform.startswith("linux"):
+        try:
+            watcher = InotifyWatcher(path)
+        except OSError as e:
+            logger.warning("inotify unavailable, falling back to polling: %s", e)
+
+    # Look the logfile up relative to an fd on its directory, so rotation checks
+    # and reopens don't walk the full path each time
+    name = os.path.basename(path)
+    parent_fd = None
+    if os.stat in os.supports_dir_fd and os.open in os.supports_dir_fd:
+        try:
+            parent_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+        except OSError:
+            parent_fd = None
+
+    def stat_path():
+        if parent_fd is not None:
+            return os.stat(name, dir_fd=parent_fd)
+        return os.stat(path)
+
+    def open_path():
+        # Raw bytes, unbuffered: we read with os.read on the fd, so BufferedReader
+        # would only add a copy, and we track the offset ourselves instead of tell()
+        if parent_fd is not None:
+            return open(os.open(name, os.O_RDONLY | os.O_CLOEXEC, dir_fd=parent_fd), "rb", buffering=0)
+        return open(path, "rb", buffering=0)
+
+    # Stat'ing the path costs a lookup, so only check for rotation when inotify
+    # reports a rename/delete/create, or every stat_every wakes otherwise
+    stat_every = 5
+    wakes = 0
+
+    async def wait_for_change():
+        """Wait for the next wake; return True if the path should be checked for rotation."""
+        nonlocal wakes
+        moved = False
+        if watcher is not None:
+            moved = await watcher.wait(watch_timeout)
+        else:
+            await asyncio.sleep(poll_interval)
+        wakes += 1
+        if moved or wakes >= stat_every:
+            wakes = 0
+            return True
+        return False
+
+    try:
+        # Read logfile as raw bytes; they are forwarded to clients unchanged
+        with open_path() as f:
+            if watcher is not None:
+                watcher.watch_file(path, f.fileno())
             # Seek to end
-            f.seek(0, os.SEEK_END)
-            inode = os.fstat(f.fileno()).st_ino
+            where = f.seek(0, os.SEEK_END)
+            last_stat = os.fstat(f.fileno())
+            recheck = False
+            # Incomplete last line, sent once its newline shows up
+            pending = b""
             while True:
-                where = f.tell()
-                line = f.readline()
-                if line:
-                    await broadcaster(line)
+                # One syscall and one scan per burst instead of a readline() per line
+                chunk = os.read(f.fileno(), READ_SIZE)
+                if chunk:
+                    where += len(chunk)
+                    data, pending = split_lines(pending, chunk)
+                    if data is not None:
+                        await broadcaster(data)
+                    # Let the client senders run before reading the next chunk
+                    await asyncio.sleep(0)
                 else:
-                    await asyncio.sleep(poll_interval)
+                    if recheck:
+                        recheck = False
+                        check_path = True
+                    else:
+                        check_path = await wait_for_change()
+                    # Detect truncation (copytruncate) by comparing size; the open fd
+                    # still refers to the truncated file, so fstat is enough
                     try:
-                        stat_info = os.stat(path)
-                    except FileNotFoundError:
-                        # File removed; wait until it reappears
-                        await asyncio.sleep(poll_interval)
+                        if os.fstat(f.fileno()).st_size < where:
+                            where = f.seek(0, os.SEEK_SET)
+                            if pending:
+                                await broadcaster(pending)
+                                pending = b""
+                            continue
+                    except Exception:
+                        pass
+                    if not check_path:
                         continue
-                    # If inode changed, reopened file (rotated)
                     try:
-                        cur_inode = stat_info.st_ino
-                    except AttributeError:
-                        cur_inode = None
-                    if cur_inode is not None and cur_inode != inode:
+                        stat_info = stat_path()
+                    except FileNotFoundError:
+                        # File removed; wait until it reappears, then stat again right away
+                        await wait_for_change()
+                        recheck = True
+                        continue
+                    # If the path points at a different file (device + inode), it was rotated
+                    if not os.path.samestat(last_stat, stat_info):
                         # Reopen the file and continue
                         try:
-                            newf = open(path, "r", encoding="utf-8", errors="replace")
+                            newf = open_path()
                         except Exception:
-                            await asyncio.sleep(poll_interval)
+                            await wait_for_change()
+                            recheck = True
                             continue
+                        # Lines written to the old file just before the rename are
+                        # still readable through its fd: send them before switching
+                        while True:
+                            chunk = os.read(f.fileno(), READ_SIZE)
+                            if not chunk:
+                                break
+                            data, pending = split_lines(pending, chunk)
+                            if data is not None:
+                                await broadcaster(data)
+                            await asyncio.sleep(0)
                         f.close()
                         f = newf
-                        inode = os.fstat(f.fileno()).st_ino
+                        if pending:
+                            await broadcaster(pending)
+                            pending = b""
+                        last_stat = os.fstat(f.fileno())
+                        where = 0
+                        if watcher is not None:
+                            watcher.watch_file(path, f.fileno())
                         # start at beginning of new file
                         continue
-                    # Detect truncation (copytruncate) by comparing size
-                    try:
-                        if stat_info.st_size < where:
-                            f.seek(0, os.SEEK_SET)
-                    except Exception:
-                        pass
     except Exception as e:
         # Log the exception for investigation
-        print(f"tail_file error: {e}")
+        logger.error("tail_file error: %s", e)
+    finally:
+        if watcher is not None:
+            watcher.close()
+        if parent_fd is not None:
+            os.close(parent_fd)
 
 
 class Broadcaster:
-    def __init__(self):
-        self.clients = set()
-        self.lock = asyncio.Lock()
-
-    async def register(self, writer: asyncio.StreamWriter):
-        async with self.lock:
-            self.clients.add(writer)
-
-    async def unregister(self, writer: asyncio.StreamWriter):
-        async with self.lock:
-            self.clients.discard(writer)
-
-    async def broadcast(self, data: str):
-        # Copy clients under lock, but perform IO (which may block) without holding the lock
-        async with self.lock:
-            clients = list(self.clients)
-
-        to_remove = []
-        # Write to all clients (non-blocking write), collect failures
-        for w in clients:
+    # Each client gets a bounded queue drained by its own sender task, so a slow
+    # client only backs up its own queue; broadcast() never waits for it. A client
+    # is evicted when its queue fills up, or stays at high_water for stall_timeout.
+    # That relies on the tail readers yielding after every chunk so the senders
+    # get scheduled; otherwise a full queue would say nothing about the client.
+    # No lock needed: everything runs on the event loop thread, and the dicts
+    # are never mutated across an await.
+    def __init__(self, queue_size=1024, flush_delay=0.002, flush_size=256 * 1024, stall_timeout=5.0):
+        self.queue_size = queue_size
+        self.high_water = max(1, queue_size // 2)
+        self.stall_timeout = stall_timeout
+        # When each backlogged client's queue first reached high_water
+        self.behind_since = {}
+        self.queues = {}
+        self.senders = {}
+        # Peer address captured once at register, for log messages
+        self.peers = {}
+        # Bursts arriving within flush_delay are sent as one buffer; flush_size
+        # caps how much is held back before flushing right away
+        self.flush_delay = flush_delay
+        self.flush_size = flush_size
+        self._pending = []
+        self._pending_size = 0
+        self._flush_handle = None
+
+    def register(self, writer: asyncio.StreamWriter, peer=None):
+        if peer is None:
+            peer = writer.get_extra_info('peername')
+        self.peers[writer] = peer
+        q = asyncio.Queue(maxsize=self.queue_size)
+        self.queues[writer] = q
+        self.senders[writer] = asyncio.create_task(self._sender(writer, q))
+
+    def unregister(self, writer: asyncio.StreamWriter):
+        self.peers.pop(writer, None)
+        self.behind_since.pop(writer, None)
+        self.queues.pop(writer, None)
+        task = self.senders.pop(writer, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    def _disconnect(self, writer: asyncio.StreamWriter):
+        # Drop the client and abort its connection (close() would wait for a stalled
+        # peer to accept the buffered data); handle_client sees EOF and cleans up
+        self.unregister(writer)
+        try:
+            writer.transport.abort()
+        except Exception:
+            pass
+
+    async def _sender(self, writer: asyncio.StreamWriter, q: asyncio.Queue):
+        try:
+            while True:
+                data = await q.get()
+                # Raw logfile bytes, shared by all clients. The transport hands this
+                # buffer to send() directly while the socket isn't backed up, so
+                # fan-out costs no extra copies (loop.sendfile wouldn't save any and
+                # would have to re-read ranges a copytruncate may have rewritten)
+                writer.write(data)
+                # Catching up: write what's already queued, then drain once. Capped
+                # at flush_size per pass, since the transport may copy what it can't
+                # send right away and the queue should stay the client's backlog
+                written = len(data)
+                while written < self.flush_size and not q.empty():
+                    data = q.get_nowait()
+                    writer.write(data)
+                    written += len(data)
+                await writer.drain()
+        except Exception as e:
+            logger.warning("Error writing to client %s: %s", self.peers.get(writer), e)
+            self._disconnect(writer)
+
+    def _evict_slow(self, writer: asyncio.StreamWriter):
+        logger.warning("Removing client that is too slow to keep up: %s", self.peers.get(writer))
+        self._disconnect(writer)
+
+    def _stalled(self, writer: asyncio.StreamWriter, q: asyncio.Queue):
+        """Track how long the client's queue has sat at high_water.
+        Returns True once it has been there for stall_timeout.
+        """
+        if q.qsize() < self.high_water:
+            if self.behind_since:
+                self.behind_since.pop(writer, None)
+            return False
+        now = time.monotonic()
+        since = self.behind_since.setdefault(writer, now)
+        return now - since >= self.stall_timeout
+
+    async def broadcast(self, data):
+        # Nobody connected: nothing to buffer
+        if not self.queues:
+            return
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= self.flush_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.flush_delay, self._flush)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        self._pending_size = 0
+        # A lone burst goes out as-is (no copy); several are joined once for all clients
+        data = pending[0] if len(pending) == 1 else b"".join(pending)
+
+        # Common shapes first: nobody connected, or a single client
+        n = len(self.queues)
+        if n == 0:
+            return
+        if n == 1:
+            w, q = next(iter(self.queues.items()))
             try:
-                # Send UTF-8 over the wire so non-ASCII characters are preserved
-                w.write(data.encode("utf-8"))
-            except Exception as e:
-                peer = None
-                try:
-                    peer = w.get_extra_info('peername')
-                except Exception:
-                    pass
-                print(f"Error writing to client {peer}: {e}")
-                to_remove.append(w)
-
-        # Drain each writer separately so a slow client doesn't block others
-        for w in clients:
-            if w in to_remove:
-                continue
+                q.put_nowait(data)
+            except asyncio.QueueFull:
+                self._evict_slow(w)
+                return
+            if self._stalled(w, q):
+                self._evict_slow(w)
+            return
+
+        to_remove = None
+        # Never blocks: just hand the buffer to every client's queue. Nothing here
+        # awaits or mutates self.queues (evictions wait for the loop to finish),
+        # so iterate the dict directly instead of copying it per broadcast
+        for w, q in self.queues.items():
             try:
-                await w.drain()
-            except Exception as e:
-                peer = None
-                try:
-                    peer = w.get_extra_info('peername')
-                except Exception:
-                    pass
-                print(f"Draining failed for client {peer}: {e}")
-                to_remove.append(w)
+                q.put_nowait(data)
+            except asyncio.QueueFull:
+                pass
+            else:
+                if not self._stalled(w, q):
+                    continue
+            if to_remove is None:
+                to_remove = []
+            to_remove.append(w)
 
         if to_remove:
-            async with self.lock:
-                for w in to_remove:
-                    if w in self.clients:
-                        peer = None
-                        try:
-                            peer = w.get_extra_info('peername')
-                        except Exception:
-                            pass
-                        print(f"Removing client due to error: {peer}")
-                        self.clients.discard(w)
+            for w in to_remove:
+                self._evict_slow(w)
 
 
 async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, broadcaster: Broadcaster):
     addr = writer.get_extra_info("peername")
-    print(f"Client connected: {addr}")
-    await broadcaster.register(writer)
+    logger.info("Client connected: %s", addr)
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        try:
+            # Send each burst immediately (no Nagle delay) and allow a larger kernel
+            # buffer so short bursts don't hit drain() backpressure
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+            # Detect dead peers that never send FIN
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as e:
+            logger.warning("Could not set socket options for client %s: %s", addr, e)
+    broadcaster.register(writer, addr)
     try:
-        # Keep the connection open until client disconnects
+        # Keep the connection open until client disconnects; whatever the client
+        # sends is ignored, so swallow it in large reads to wake up as rarely as possible
         while True:
-            data = await reader.read(100)
+            data = await reader.read(64 * 1024)
             if not data:
                 break
             # Optional: could support simple commands from client
     finally:
-        print(f"Client disconnected: {addr}")
-        await broadcaster.unregister(writer)
+        logger.info("Client disconnected: %s", addr)
+        broadcaster.unregister(writer)
         try:
             writer.close()
             await writer.wait_closed()
@@ -148,6 +537,22 @@ async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWrit
             pass
 
 
+def setup_logging():
+    """Send log records through a queue to a background thread that writes them,
+    so the event loop never blocks on a slow stdout (pipe, docker log driver).
+    Returns the started QueueListener; stop() it to flush on exit.
+    """
+    q = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = logging.handlers.QueueListener(q, handler)
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Tail a logfile and stream new lines over TCP to clients.")
     parser.add_argument("logfile", help="Path to logfile to tail")
@@ -159,7 +564,7 @@ async def main():
 
     server = await asyncio.start_server(lambda r, w: handle_client(r, w, broadcaster), host=args.host, port=args.port)
     addr = server.sockets[0].getsockname()
-    print(f"Serving on {addr}, tailing {args.logfile}")
+    logger.info("Serving on %s, tailing %s", addr, args.logfile)
 
     async def run_tail_supervisor():
         backoff = 1.0
@@ -168,9 +573,9 @@ async def main():
                 task = asyncio.create_task(tail_file(args.logfile, broadcaster.broadcast))
                 await task
                 # If task completes normally, log and restart after backoff
-                print("tail_file task exited normally; restarting after backoff")
+                logger.warning("tail_file task exited normally; restarting after backoff")
             except Exception as e:
-                print(f"tail_file task crashed: {e}")
+                logger.error("tail_file task crashed: %s", e)
             await asyncio.sleep(backoff)
             backoff = min(backoff * 2, 30.0)
 
@@ -180,8 +585,24 @@ async def main():
         await server.serve_forever()
 
 
+def run(coro):
+    """asyncio.run() on uvloop when it is installed, the default loop otherwise."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    logger.info("Using uvloop event loop")
+    if sys.version_info >= (3, 12):
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
+    listener = setup_logging()
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
-        print("Shutting down")
+        logger.info("Shutting down")
+    finally:
+        listener.stop()